@@ -9,11 +9,12 @@ and the corresponding JSON representation (https://api.test.datacite.org/dois/10
 
 The converter performs the following steps:
 
-* Parse the XML document using ``xml.etree.ElementTree``.  Namespace handling
-  is simplified by registering the DataCite namespace and stripping it when
-  building the result.
-* Walk through each major element (identifier, creators, titles, etc.) and
-  assemble Python dictionaries/lists corresponding to DataCite JSON fields.
+* Parse the XML document using ``lxml.etree`` when it is installed, falling
+  back to ``xml.etree.ElementTree`` otherwise.  Namespace handling is
+  simplified by precomputing the fully-qualified DataCite tag names.
+* Walk the root's children once, dispatching on each element's tag
+  (identifier, creators, titles, etc.) to a handler that assembles the
+  Python dictionaries/lists corresponding to DataCite JSON fields.
 * Convert attribute names from camelCase in XML to the lowerCamelCase used
   by DataCite JSON (e.g. ``rightsURI`` → ``rightsUri``, ``schemeURI`` →
   ``schemeUri``).  Where the JSON specification expects plural lists
@@ -28,82 +29,225 @@ The converter performs the following steps:
   ensures that the original metadata can be reconstructed from the JSON.
 
 The script writes its output as pretty‑printed JSON to stdout by default,
-but can write to a file when the ``--output`` option is used.
+but can write to a file when the ``--output`` option is used.  Several files
+(or directories of ``*.xml`` files) can be converted in parallel with
+``--output-dir``, which writes one ``<name>.json`` per input.
 
 Example usage:
 
     python xml_to_datacite_json.py datacite-example-full-v4.xml --output record.json
+    python xml_to_datacite_json.py records/ --output-dir json/ --workers 8
 
 """
 
 import argparse
-import base64
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
+try:
+    import lxml.etree as ET
 
-# Namespace for DataCite Kernel‑4 XML.  When parsing, we need to prefix
-# element names with this namespace.  Register it globally to ease lookups.
+    # Before lxml 5, entity resolution is all-or-nothing: the default expands
+    # external (e.g. file://) entities too.  Use ElementTree there instead.
+    if ET.LXML_VERSION < (5,):
+        raise ImportError("lxml >= 5 is required for internal-only entity resolution")
+except ImportError:  # pragma: no cover - exercised when lxml is missing or too old
+    import xml.etree.ElementTree as ET
+    _PARSER = None
+    _TEXT_PARSER = None
+else:
+    # One parser instance is shared by every call; ID collection is not needed.
+    # Internal DTD entities are expanded, as ElementTree does; external ones
+    # are never loaded, so a document referencing one fails to parse.
+    # Comments and processing instructions are dropped, as ElementTree does,
+    # so text split around them is merged and output does not depend on lxml.
+    _PARSER = ET.XMLParser(
+        huge_tree=False,
+        collect_ids=False,
+        resolve_entities="internal",
+        remove_comments=True,
+        remove_pis=True,
+    )
+    # For documents passed as str: they are encoded to UTF-8 before parsing,
+    # so any encoding named in their XML declaration must be overridden.
+    _TEXT_PARSER = ET.XMLParser(
+        encoding="utf-8",
+        huge_tree=False,
+        collect_ids=False,
+        resolve_entities="internal",
+        remove_comments=True,
+        remove_pis=True,
+    )
+
+try:
+    # SIMD-accelerated encoder; output is identical to the stdlib's.
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # pragma: no cover - exercised when pybase64 is not installed
+    from base64 import b64encode as _b64encode
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+
+# Namespace for DataCite Kernel‑4 XML.  Element tags are compared in Clark
+# notation ("{ns}local"); the qualified names are built once with _q() below.
 DC_NS = "http://datacite.org/schema/kernel-4"
-NSMAP = {"d": DC_NS}
+# xml:lang as it appears in an element's attributes (Clark notation).
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+
+def _q(name: str) -> str:
+    """Return the fully-qualified (Clark notation) tag for a DataCite element."""
+    return f"{{{DC_NS}}}{name}"
+
+
+TAG_ALTERNATEIDENTIFIER = _q("alternateIdentifier")
+TAG_CREATORS = _q("creators")
+TAG_CREATOR = _q("creator")
+TAG_CREATORNAME = _q("creatorName")
+TAG_GIVENNAME = _q("givenName")
+TAG_FAMILYNAME = _q("familyName")
+TAG_NAMEIDENTIFIER = _q("nameIdentifier")
+TAG_AFFILIATION = _q("affiliation")
+TAG_TITLES = _q("titles")
+TAG_TITLE = _q("title")
+TAG_PUBLICATIONYEAR = _q("publicationYear")
+TAG_CONTRIBUTORS = _q("contributors")
+TAG_SUBJECT = _q("subject")
+TAG_CONTRIBUTOR = _q("contributor")
+TAG_DATE = _q("date")
+TAG_RELATEDIDENTIFIER = _q("relatedIdentifier")
+TAG_RELATEDITEM = _q("relatedItem")
+TAG_RELATEDITEMIDENTIFIER = _q("relatedItemIdentifier")
+TAG_NUMBER = _q("number")
+TAG_SIZE = _q("size")
+TAG_FORMAT = _q("format")
+TAG_RIGHTS = _q("rights")
+TAG_DESCRIPTION = _q("description")
+TAG_GEOLOCATION = _q("geoLocation")
+TAG_GEOLOCATIONPLACE = _q("geoLocationPlace")
+TAG_GEOLOCATIONPOINT = _q("geoLocationPoint")
+TAG_GEOLOCATIONBOX = _q("geoLocationBox")
+TAG_GEOLOCATIONPOLYGON = _q("geoLocationPolygon")
+TAG_POLYGONPOINT = _q("polygonPoint")
+TAG_POINTLATITUDE = _q("pointLatitude")
+TAG_POINTLONGITUDE = _q("pointLongitude")
+TAG_FUNDINGREFERENCE = _q("fundingReference")
+TAG_FUNDERNAME = _q("funderName")
+TAG_FUNDERIDENTIFIER = _q("funderIdentifier")
+TAG_AWARDNUMBER = _q("awardNumber")
+TAG_AWARDTITLE = _q("awardTitle")
+
+
+# (XML attribute, JSON key) pairs copied verbatim by _copy_attrs().
+SUBJECT_ATTRS = (
+    ("subjectScheme", "subjectScheme"),
+    ("schemeURI", "schemeUri"),
+    ("valueURI", "valueUri"),
+    ("classificationCode", "classificationCode"),
+)
+RELATED_IDENTIFIER_ATTRS = (
+    ("relatedIdentifierType", "relatedIdentifierType"),
+    ("relationType", "relationType"),
+    ("relatedMetadataScheme", "relatedMetadataScheme"),
+    ("schemeURI", "schemeUri"),
+    ("schemeType", "schemeType"),
+    ("resourceTypeGeneral", "resourceTypeGeneral"),
+)
+RELATED_ITEM_ATTRS = (
+    ("relatedItemType", "relatedItemType"),
+    ("relationType", "relationType"),
+)
+RELATED_ITEM_IDENTIFIER_ATTRS = (
+    ("relatedItemIdentifierType", "relatedItemIdentifierType"),
+    ("relatedMetadataScheme", "relatedMetadataScheme"),
+    ("schemeURI", "schemeUri"),
+    ("schemeType", "schemeType"),
+)
+
+
+def _copy_attrs(elem: ET.Element, dst: Dict[str, Any], mapping: Iterable[Tuple[str, str]]) -> None:
+    """Copy each present XML attribute in ``mapping`` to ``dst`` under its JSON key."""
+    get = elem.get
+    for xml_attr, json_key in mapping:
+        val = get(xml_attr)
+        if val is not None:
+            dst[json_key] = val
 
 
 def get_text(element: Optional[ET.Element]) -> Optional[str]:
     """Return the text content of an element or None if missing."""
-    if element is not None and element.text is not None:
-        return element.text.strip() or None
-    return None
+    if element is None:
+        return None
+    text = element.text
+    if not text:
+        return None
+    # Most values carry no surrounding whitespace; skip the strip() copy then.
+    if not text[0].isspace() and not text[-1].isspace():
+        return text
+    return text.strip() or None
 
 
 def convert_name_identifier(elem: ET.Element) -> Dict[str, Any]:
     """Convert a <nameIdentifier> element into a JSON object."""
     return {
         "nameIdentifier": get_text(elem),
-        "nameIdentifierScheme": elem.attrib.get("nameIdentifierScheme"),
-        "schemeUri": elem.attrib.get("schemeURI"),
+        "nameIdentifierScheme": elem.get("nameIdentifierScheme"),
+        "schemeUri": elem.get("schemeURI"),
     }
 
 
-def convert_affiliation(elem: ET.Element) -> Dict[str, Any]:
-    """Convert an <affiliation> element into a JSON object."""
+def convert_creator_affiliation(elem: ET.Element) -> Any:
+    """Convert an <affiliation> element nested in a creator or contributor.
+
+    When building the JSON, DataCite's examples sometimes use a list of
+    simple strings for affiliation.  To preserve richer information we
+    provide objects with name and identifiers.  If no attributes beyond
+    name are present, collapse to just the name string.
+    """
+    name = get_text(elem)
+    identifier = elem.get("affiliationIdentifier")
+    scheme = elem.get("affiliationIdentifierScheme")
+    scheme_uri = elem.get("schemeURI")
+    # collapse if only name is present
+    if name and not (identifier or scheme or scheme_uri):
+        return name
     return {
-        "name": get_text(elem),
-        "affiliationIdentifier": elem.attrib.get("affiliationIdentifier"),
-        "affiliationIdentifierScheme": elem.attrib.get("affiliationIdentifierScheme"),
-        "schemeUri": elem.attrib.get("schemeURI"),
+        "name": name,
+        "affiliationIdentifier": identifier,
+        "affiliationIdentifierScheme": scheme,
+        "schemeUri": scheme_uri,
     }
 
 
 def convert_creator(elem: ET.Element) -> Dict[str, Any]:
     """Convert a <creator> element into a JSON object."""
-    # Creator name may appear as <creatorName> with nameType attribute
-    creator_name_elem = elem.find("d:creatorName", NSMAP)
-    name = get_text(creator_name_elem)
-    name_type = creator_name_elem.attrib.get("nameType") if creator_name_elem is not None else None
-    given = get_text(elem.find("d:givenName", NSMAP))
-    family = get_text(elem.find("d:familyName", NSMAP))
-    # Name identifiers
+    name = None
+    name_type = None
+    given = None
+    family = None
     name_ids = []
-    for ni in elem.findall("d:nameIdentifier", NSMAP):
-        name_ids.append(convert_name_identifier(ni))
-    # Affiliations
-    affiliations = []
-    for aff in elem.findall("d:affiliation", NSMAP):
-        affiliations.append(convert_affiliation(aff))
-    # When building the JSON, DataCite's examples sometimes use a list of
-    # simple strings for affiliation.  To preserve richer information we
-    # provide objects with name and identifiers.  If no attributes beyond
-    # name are present, collapse to just the name string.
     aff_output: List[Any] = []
-    for a in affiliations:
-        # collapse if only name is present
-        if a and a.get("name") and not any([a.get("affiliationIdentifier"), a.get("affiliationIdentifierScheme"), a.get("schemeUri")]):
-            aff_output.append(a["name"])
-        else:
-            aff_output.append(a)
+    for c in elem:
+        tag = c.tag
+        # Creator name may appear as <creatorName> with nameType attribute
+        if tag == TAG_CREATORNAME:
+            name = get_text(c)
+            name_type = c.get("nameType")
+        elif tag == TAG_GIVENNAME:
+            given = get_text(c)
+        elif tag == TAG_FAMILYNAME:
+            family = get_text(c)
+        elif tag == TAG_NAMEIDENTIFIER:
+            name_ids.append(convert_name_identifier(c))
+        elif tag == TAG_AFFILIATION:
+            aff_output.append(convert_creator_affiliation(c))
     creator_obj: Dict[str, Any] = {
         "name": name,
         "nameType": name_type,
@@ -120,7 +264,7 @@ def convert_creator(elem: ET.Element) -> Dict[str, Any]:
 def convert_contributor(elem: ET.Element) -> Dict[str, Any]:
     """Convert a <contributor> element into a JSON object."""
     obj = convert_creator(elem)  # share name parsing logic
-    contributor_type = elem.attrib.get("contributorType")
+    contributor_type = elem.get("contributorType")
     if contributor_type:
         obj["contributorType"] = contributor_type
     return obj
@@ -130,10 +274,10 @@ def convert_title(elem: ET.Element) -> Dict[str, Any]:
     """Convert a <title> element into a JSON object."""
     obj: Dict[str, Any] = {"title": get_text(elem)}
     # xml:lang is stored with namespace xlm; in ElementTree it's an attribute with full name
-    lang = elem.attrib.get("{http://www.w3.org/XML/1998/namespace}lang")
+    lang = elem.get(XML_LANG)
     if lang:
         obj["lang"] = lang
-    title_type = elem.attrib.get("titleType")
+    title_type = elem.get("titleType")
     if title_type:
         obj["titleType"] = title_type
     return obj
@@ -142,203 +286,214 @@ def convert_title(elem: ET.Element) -> Dict[str, Any]:
 def convert_subject(elem: ET.Element) -> Dict[str, Any]:
     """Convert a <subject> element into a JSON object."""
     obj: Dict[str, Any] = {"subject": get_text(elem)}
-    lang = elem.attrib.get("{http://www.w3.org/XML/1998/namespace}lang")
+    lang = elem.get(XML_LANG)
     if lang:
         obj["lang"] = lang
     # Additional attributes
-    for xml_attr, json_key in [
-        ("subjectScheme", "subjectScheme"),
-        ("schemeURI", "schemeUri"),
-        ("valueURI", "valueUri"),
-        ("classificationCode", "classificationCode"),
-    ]:
-        val = elem.attrib.get(xml_attr)
-        if val is not None:
-            obj[json_key] = val
+    _copy_attrs(elem, obj, SUBJECT_ATTRS)
     return obj
 
 
-def convert_name_identifiers(parent: ET.Element) -> List[Dict[str, Any]]:
-    """Convert nested <nameIdentifier> elements found under contributors/creators."""
-    result = []
-    for elem in parent.findall("d:nameIdentifier", NSMAP):
-        result.append(convert_name_identifier(elem))
-    return result
-
-
-def convert_dates(root: ET.Element) -> List[Dict[str, Any]]:
-    dates = []
-    for d_elem in root.findall("d:dates/d:date", NSMAP):
-        date_obj: Dict[str, Any] = {"date": get_text(d_elem)}
-        dt = d_elem.attrib.get("dateType")
-        if dt:
-            date_obj["dateType"] = dt
-        di = d_elem.attrib.get("dateInformation")
-        if di:
-            date_obj["dateInformation"] = di
-        dates.append(date_obj)
-    return dates
+def convert_date(elem: ET.Element) -> Dict[str, Any]:
+    """Convert a <date> element into a JSON object."""
+    date_obj: Dict[str, Any] = {"date": get_text(elem)}
+    dt = elem.get("dateType")
+    if dt:
+        date_obj["dateType"] = dt
+    di = elem.get("dateInformation")
+    if di:
+        date_obj["dateInformation"] = di
+    return date_obj
 
 
 def convert_related_identifier(elem: ET.Element) -> Dict[str, Any]:
     """Convert a <relatedIdentifier> element into a JSON object."""
     obj: Dict[str, Any] = {"relatedIdentifier": get_text(elem)}
     # Map attributes to JSON keys
-    for xml_attr, json_key in [
-        ("relatedIdentifierType", "relatedIdentifierType"),
-        ("relationType", "relationType"),
-        ("relatedMetadataScheme", "relatedMetadataScheme"),
-        ("schemeURI", "schemeUri"),
-        ("schemeType", "schemeType"),
-        ("resourceTypeGeneral", "resourceTypeGeneral"),
-    ]:
-        val = elem.attrib.get(xml_attr)
-        if val is not None:
-            obj[json_key] = val
+    _copy_attrs(elem, obj, RELATED_IDENTIFIER_ATTRS)
     return obj
 
 
+# Simple text children of <relatedItem>, in the order they are emitted.
+RELATED_ITEM_FIELDS = (
+    ("volume", "volume"),
+    ("issue", "issue"),
+    ("number", "number"),
+    ("firstPage", "firstPage"),
+    ("lastPage", "lastPage"),
+    ("publisher", "publisher"),
+    ("edition", "edition"),
+)
+_RELATED_ITEM_FIELD_TAGS = {_q(tag): tag for tag, _ in RELATED_ITEM_FIELDS}
+
+
 def convert_related_item(elem: ET.Element) -> Dict[str, Any]:
     """Convert a <relatedItem> element into a JSON object."""
     obj: Dict[str, Any] = {}
     # Attributes
-    for xml_attr, json_key in [
-        ("relatedItemType", "relatedItemType"),
-        ("relationType", "relationType"),
-    ]:
-        val = elem.attrib.get(xml_attr)
-        if val is not None:
-            obj[json_key] = val
+    _copy_attrs(elem, obj, RELATED_ITEM_ATTRS)
+    rid = None
+    creators_elem = None
+    titles_elem = None
+    pub_year = None
+    number_type = None
+    fields: Dict[str, Optional[str]] = {}
+    rel_contribs_elem = None
+    for c in elem:
+        tag = c.tag
+        if tag == TAG_RELATEDITEMIDENTIFIER:
+            rid = c
+        elif tag == TAG_CREATORS:
+            creators_elem = c
+        elif tag == TAG_TITLES:
+            titles_elem = c
+        elif tag == TAG_PUBLICATIONYEAR:
+            pub_year = get_text(c)
+        elif tag == TAG_CONTRIBUTORS:
+            rel_contribs_elem = c
+        elif tag in _RELATED_ITEM_FIELD_TAGS:
+            fields[_RELATED_ITEM_FIELD_TAGS[tag]] = get_text(c)
+            # For <number>, capture numberType
+            if tag == TAG_NUMBER:
+                number_type = c.get("numberType")
     # Related item identifier
-    rid = elem.find("d:relatedItemIdentifier", NSMAP)
     if rid is not None:
         rid_obj: Dict[str, Any] = {"relatedItemIdentifier": get_text(rid)}
-        for xml_attr, json_key in [
-            ("relatedItemIdentifierType", "relatedItemIdentifierType"),
-            ("relatedMetadataScheme", "relatedMetadataScheme"),
-            ("schemeURI", "schemeUri"),
-            ("schemeType", "schemeType"),
-        ]:
-            val = rid.attrib.get(xml_attr)
-            if val is not None:
-                rid_obj[json_key] = val
+        _copy_attrs(rid, rid_obj, RELATED_ITEM_IDENTIFIER_ATTRS)
         obj["relatedItemIdentifier"] = rid_obj
     # Creators
-    creators_elem = elem.find("d:creators", NSMAP)
     if creators_elem is not None:
-        rel_creators: List[Dict[str, Any]] = []
-        for c in creators_elem.findall("d:creator", NSMAP):
-            rel_creators.append(convert_creator(c))
+        rel_creators = [convert_creator(c) for c in creators_elem if c.tag == TAG_CREATOR]
         if rel_creators:
             obj["creators"] = rel_creators
     # Titles
-    titles_elem = elem.find("d:titles", NSMAP)
     if titles_elem is not None:
-        rel_titles: List[Dict[str, Any]] = []
-        for t in titles_elem.findall("d:title", NSMAP):
-            rel_titles.append(convert_title(t))
+        rel_titles = [convert_title(t) for t in titles_elem if t.tag == TAG_TITLE]
         if rel_titles:
             obj["titles"] = rel_titles
     # Publication year
-    pub_year = get_text(elem.find("d:publicationYear", NSMAP))
     if pub_year is not None:
         obj["publicationYear"] = pub_year
     # Additional simple fields
-    for tag, key in [
-        ("volume", "volume"),
-        ("issue", "issue"),
-        ("number", "number"),
-        ("firstPage", "firstPage"),
-        ("lastPage", "lastPage"),
-        ("publisher", "publisher"),
-        ("edition", "edition"),
-    ]:
-        val = get_text(elem.find(f"d:{tag}", NSMAP))
+    for tag, key in RELATED_ITEM_FIELDS:
+        val = fields.get(tag)
         if val is not None:
             obj[key] = val
-        # For <number>, capture numberType
-        if tag == "number":
-            number_elem = elem.find("d:number", NSMAP)
-            if number_elem is not None:
-                nt = number_elem.attrib.get("numberType")
-                if nt:
-                    obj["numberType"] = nt
+        if tag == "number" and number_type:
+            obj["numberType"] = number_type
     # Contributors inside related item
-    rel_contribs_elem = elem.find("d:contributors", NSMAP)
     if rel_contribs_elem is not None:
-        rel_contribs: List[Dict[str, Any]] = []
-        for c in rel_contribs_elem.findall("d:contributor", NSMAP):
-            rel_contribs.append(convert_contributor(c))
+        rel_contribs = [convert_contributor(c) for c in rel_contribs_elem if c.tag == TAG_CONTRIBUTOR]
         if rel_contribs:
             obj["contributors"] = rel_contribs
     return obj
 
 
-def resource_type_mappings(resource_type_general: str) -> Dict[str, str]:
+# Recommended crosswalks from resourceTypeGeneral (lower-cased) to RIS,
+# BibTeX, CiteProc and Schema.org types.  The tables are read-only views so
+# callers cannot alter them for later records.
+RESOURCE_TYPE_MAPPINGS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "dataset": MappingProxyType({"ris": "DATA", "bibtex": "misc", "citeproc": "dataset", "schemaOrg": "Dataset"}),
+    "collection": MappingProxyType({"ris": "GEN", "bibtex": "misc", "citeproc": "dataset", "schemaOrg": "Collection"}),
+    "text": MappingProxyType({"ris": "GEN", "bibtex": "article", "citeproc": "article", "schemaOrg": "ScholarlyArticle"}),
+    "audiovisual": MappingProxyType({"ris": "AV", "bibtex": "misc", "citeproc": "motion_picture", "schemaOrg": "VideoObject"}),
+    "image": MappingProxyType({"ris": "IMAGE", "bibtex": "misc", "citeproc": "graphic", "schemaOrg": "ImageObject"}),
+    "software": MappingProxyType({"ris": "COMP", "bibtex": "software", "citeproc": "software", "schemaOrg": "SoftwareSourceCode"}),
+    "other": MappingProxyType({"ris": "GEN", "bibtex": "misc", "citeproc": "other", "schemaOrg": "CreativeWork"}),
+})
+DEFAULT_RESOURCE_TYPE_MAPPING: Mapping[str, str] = MappingProxyType({
+    "ris": "GEN",
+    "bibtex": "misc",
+    "citeproc": "other",
+    "schemaOrg": "CreativeWork",
+})
+
+
+def resource_type_mappings(resource_type_general: str) -> Mapping[str, str]:
     """Return mapping of RIS, BibTeX, CiteProc, and Schema.org types for a given resourceTypeGeneral.
 
     DataCite provides recommended mappings from their resourceTypeGeneral values
     to other classification schemes.  This function covers the most common
-    types; unknown types default to generic placeholders.
+    types; unknown types default to generic placeholders.  The result is a
+    read-only view of a module table; copy it (e.g. via ``dict.update``) to
+    build a modifiable dict.
     """
-    general = (resource_type_general or "").lower()
-    mappings = {
-        "dataset": {"ris": "DATA", "bibtex": "misc", "citeproc": "dataset", "schemaOrg": "Dataset"},
-        "collection": {"ris": "GEN", "bibtex": "misc", "citeproc": "dataset", "schemaOrg": "Collection"},
-        "text": {"ris": "GEN", "bibtex": "article", "citeproc": "article", "schemaOrg": "ScholarlyArticle"},
-        "audiovisual": {"ris": "AV", "bibtex": "misc", "citeproc": "motion_picture", "schemaOrg": "VideoObject"},
-        "image": {"ris": "IMAGE", "bibtex": "misc", "citeproc": "graphic", "schemaOrg": "ImageObject"},
-        "software": {"ris": "COMP", "bibtex": "software", "citeproc": "software", "schemaOrg": "SoftwareSourceCode"},
-        "other": {"ris": "GEN", "bibtex": "misc", "citeproc": "other", "schemaOrg": "CreativeWork"},
-    }
-    return mappings.get(general, {"ris": "GEN", "bibtex": "misc", "citeproc": "other", "schemaOrg": "CreativeWork"})
+    general = resource_type_general.lower() if resource_type_general else ""
+    return RESOURCE_TYPE_MAPPINGS.get(general, DEFAULT_RESOURCE_TYPE_MAPPING)
+
+
+# <geoLocationBox> children, in the order they are emitted.
+GEOLOCATION_BOX_FIELDS = (
+    ("westBoundLongitude", "westBoundLongitude"),
+    ("eastBoundLongitude", "eastBoundLongitude"),
+    ("southBoundLatitude", "southBoundLatitude"),
+    ("northBoundLatitude", "northBoundLatitude"),
+)
+_GEOLOCATION_BOX_FIELD_TAGS = {_q(tag): tag for tag, _ in GEOLOCATION_BOX_FIELDS}
+
+
+def _convert_point(elem: ET.Element) -> Dict[str, Any]:
+    """Collect pointLatitude/pointLongitude from a point-like element."""
+    lat = None
+    lon = None
+    for c in elem:
+        tag = c.tag
+        if tag == TAG_POINTLATITUDE:
+            lat = get_text(c)
+        elif tag == TAG_POINTLONGITUDE:
+            lon = get_text(c)
+    point_obj: Dict[str, Any] = {}
+    if lat is not None:
+        point_obj["pointLatitude"] = lat
+    if lon is not None:
+        point_obj["pointLongitude"] = lon
+    return point_obj
 
 
 def convert_geolocation(elem: ET.Element) -> Dict[str, Any]:
     """Convert a <geoLocation> element into a JSON object."""
     obj: Dict[str, Any] = {}
-    place = get_text(elem.find("d:geoLocationPlace", NSMAP))
+    place = None
+    point_elem = None
+    box_elem = None
+    polygon_elem = None
+    for c in elem:
+        tag = c.tag
+        if tag == TAG_GEOLOCATIONPLACE:
+            place = get_text(c)
+        elif tag == TAG_GEOLOCATIONPOINT:
+            point_elem = c
+        elif tag == TAG_GEOLOCATIONBOX:
+            box_elem = c
+        elif tag == TAG_GEOLOCATIONPOLYGON:
+            polygon_elem = c
     if place is not None:
         obj["geoLocationPlace"] = place
     # Point
-    point_elem = elem.find("d:geoLocationPoint", NSMAP)
     if point_elem is not None:
-        point_obj: Dict[str, Any] = {}
-        lat = get_text(point_elem.find("d:pointLatitude", NSMAP))
-        lon = get_text(point_elem.find("d:pointLongitude", NSMAP))
-        if lat is not None:
-            point_obj["pointLatitude"] = lat
-        if lon is not None:
-            point_obj["pointLongitude"] = lon
+        point_obj = _convert_point(point_elem)
         if point_obj:
             obj["geoLocationPoint"] = point_obj
     # Box
-    box_elem = elem.find("d:geoLocationBox", NSMAP)
     if box_elem is not None:
+        bounds: Dict[str, Optional[str]] = {}
+        for b in box_elem:
+            if b.tag in _GEOLOCATION_BOX_FIELD_TAGS:
+                bounds[_GEOLOCATION_BOX_FIELD_TAGS[b.tag]] = get_text(b)
         box_obj: Dict[str, Any] = {}
-        for tag in [
-            ("westBoundLongitude", "westBoundLongitude"),
-            ("eastBoundLongitude", "eastBoundLongitude"),
-            ("southBoundLatitude", "southBoundLatitude"),
-            ("northBoundLatitude", "northBoundLatitude"),
-        ]:
-            val = get_text(box_elem.find(f"d:{tag[0]}", NSMAP))
+        for tag, key in GEOLOCATION_BOX_FIELDS:
+            val = bounds.get(tag)
             if val is not None:
-                box_obj[tag[1]] = val
+                box_obj[key] = val
         if box_obj:
             obj["geoLocationBox"] = box_obj
     # Polygon
-    polygon_elem = elem.find("d:geoLocationPolygon", NSMAP)
     if polygon_elem is not None:
         polygon_points = []
-        for p in polygon_elem.findall("d:polygonPoint", NSMAP):
-            pt_obj: Dict[str, Any] = {}
-            lat = get_text(p.find("d:pointLatitude", NSMAP))
-            lon = get_text(p.find("d:pointLongitude", NSMAP))
-            if lat is not None:
-                pt_obj["pointLatitude"] = lat
-            if lon is not None:
-                pt_obj["pointLongitude"] = lon
+        for p in polygon_elem:
+            if p.tag != TAG_POLYGONPOINT:
+                continue
+            pt_obj = _convert_point(p)
             if pt_obj:
                 polygon_points.append({"polygonPoint": pt_obj})
         if polygon_points:
@@ -346,24 +501,54 @@ def convert_geolocation(elem: ET.Element) -> Dict[str, Any]:
     return obj
 
 
-def build_json_from_xml(xml_str: str) -> Dict[str, Any]:
-    """Parse a DataCite XML string and build the corresponding JSON structure."""
-    # Parse the XML document
-    root = ET.fromstring(xml_str)
-    # The DOI identifier
-    identifier_elem = root.find("d:identifier", NSMAP)
-    doi = get_text(identifier_elem) if identifier_elem is not None else None
-    # Build basic id/prefix/suffix
-    prefix, suffix = (None, None)
-    if doi and "/" in doi:
-        prefix, suffix = doi.split("/", 1)
-    attributes: Dict[str, Any] = {}
-    # DOI
+def convert_funding_reference(elem: ET.Element) -> Dict[str, Any]:
+    """Convert a <fundingReference> element into a JSON object."""
+    funder_name = None
+    funder_id = None
+    award_number = None
+    award_title = None
+    for c in elem:
+        tag = c.tag
+        if tag == TAG_FUNDERNAME:
+            funder_name = get_text(c)
+        elif tag == TAG_FUNDERIDENTIFIER:
+            funder_id = c
+        elif tag == TAG_AWARDNUMBER:
+            award_number = c
+        elif tag == TAG_AWARDTITLE:
+            award_title = get_text(c)
+    fr_obj: Dict[str, Any] = {}
+    # funderName
+    if funder_name is not None:
+        fr_obj["funderName"] = funder_name
+    if funder_id is not None:
+        fr_obj["funderIdentifier"] = get_text(funder_id)
+        if funder_id.get("funderIdentifierType"):
+            fr_obj["funderIdentifierType"] = funder_id.get("funderIdentifierType")
+        if funder_id.get("schemeURI"):
+            fr_obj["schemeUri"] = funder_id.get("schemeURI")
+    # Award number (with URI)
+    if award_number is not None:
+        fr_obj["awardNumber"] = get_text(award_number)
+        if award_number.get("awardURI"):
+            fr_obj["awardUri"] = award_number.get("awardURI")
+    # Award title
+    if award_title is not None:
+        fr_obj["awardTitle"] = award_title
+    return fr_obj
+
+
+def _do_identifier(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate doi, prefix and suffix from <identifier>."""
+    doi = get_text(elem)
     attributes["doi"] = doi
-    if prefix:
-        attributes["prefix"] = prefix
-    if suffix:
-        attributes["suffix"] = suffix
+    # Build basic prefix/suffix
+    if doi and "/" in doi:
+        attributes["prefix"], attributes["suffix"] = doi.split("/", 1)
+
+
+def _do_alternate_identifiers(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate identifiers and alternateIdentifiers from <alternateIdentifiers>."""
     # Identifiers – DataCite JSON allows for extra local identifiers
     # In this example, the "identifier" element holds the DOI.  To populate
     # identifiers we look at alternateIdentifiers and also create a copy of
@@ -371,9 +556,11 @@ def build_json_from_xml(xml_str: str) -> Dict[str, Any]:
     # accession number appears both in identifiers and alternateIdentifiers.
     identifiers: List[Dict[str, Any]] = []
     alternate_identifiers: List[Dict[str, Any]] = []
-    for alt in root.findall("d:alternateIdentifiers/d:alternateIdentifier", NSMAP):
+    for alt in elem:
+        if alt.tag != TAG_ALTERNATEIDENTIFIER:
+            continue
         alt_id = get_text(alt)
-        alt_type = alt.attrib.get("alternateIdentifierType")
+        alt_type = alt.get("alternateIdentifierType")
         alt_obj = {
             "alternateIdentifier": alt_id,
             "alternateIdentifierType": alt_type,
@@ -381,212 +568,305 @@ def build_json_from_xml(xml_str: str) -> Dict[str, Any]:
         alternate_identifiers.append(alt_obj)
         # Mirror into identifiers list
         identifiers.append({"identifier": alt_id, "identifierType": alt_type})
-    if identifiers:
-        attributes["identifiers"] = identifiers
-    if alternate_identifiers:
-        attributes["alternateIdentifiers"] = alternate_identifiers
-    # Creators
-    creators_elem = root.find("d:creators", NSMAP)
-    creators: List[Dict[str, Any]] = []
-    if creators_elem is not None:
-        for c in creators_elem.findall("d:creator", NSMAP):
-            creators.append(convert_creator(c))
-    if creators:
-        attributes["creators"] = creators
-    # Titles
-    titles_elem = root.find("d:titles", NSMAP)
-    titles: List[Dict[str, Any]] = []
-    if titles_elem is not None:
-        for t in titles_elem.findall("d:title", NSMAP):
-            titles.append(convert_title(t))
-    if titles:
-        attributes["titles"] = titles
-    # Publisher
-    publisher_elem = root.find("d:publisher", NSMAP)
-    if publisher_elem is not None:
-        publisher_obj: Dict[str, Any] = {"name": get_text(publisher_elem)}
-        lang = publisher_elem.attrib.get("{http://www.w3.org/XML/1998/namespace}lang")
-        if lang:
-            publisher_obj["lang"] = lang
-        # Additional identifiers
-        if publisher_elem.attrib.get("publisherIdentifier"):
-            publisher_obj["publisherIdentifier"] = publisher_elem.attrib.get("publisherIdentifier")
-        if publisher_elem.attrib.get("publisherIdentifierScheme"):
-            publisher_obj["publisherIdentifierScheme"] = publisher_elem.attrib.get("publisherIdentifierScheme")
-        if publisher_elem.attrib.get("schemeURI"):
-            publisher_obj["schemeUri"] = publisher_elem.attrib.get("schemeURI")
-        attributes["publisher"] = publisher_obj
-    # Container – derive from relatedIdentifier of type PURL and description of type SeriesInformation
-    container_obj: Dict[str, Any] = {}
-    # Determine container type from resourceTypeGeneral
-    resource_type_elem = root.find("d:resourceType", NSMAP)
-    resource_type_general = resource_type_elem.attrib.get("resourceTypeGeneral") if resource_type_elem is not None else None
-    if resource_type_general:
-        # Use a generic container type for dataset
-        if resource_type_general.lower() == "dataset":
-            container_obj["type"] = "DataRepository"
-    # Find first relatedIdentifier with type PURL
-    purl_elem = None
-    for ri in root.findall("d:relatedIdentifiers/d:relatedIdentifier", NSMAP):
-        if ri.attrib.get("relatedIdentifierType") == "PURL":
-            purl_elem = ri
-            break
-    if purl_elem is not None:
-        container_obj["identifier"] = get_text(purl_elem)
-        container_obj["identifierType"] = purl_elem.attrib.get("relatedIdentifierType")
-    # Container title from description of type SeriesInformation
-    for desc in root.findall("d:descriptions/d:description", NSMAP):
-        if desc.attrib.get("descriptionType") == "SeriesInformation":
-            container_obj["title"] = get_text(desc)
-            break
-    if container_obj:
-        attributes["container"] = container_obj
-    # Publication year
-    pub_year = get_text(root.find("d:publicationYear", NSMAP))
+    attributes["identifiers"] = identifiers
+    attributes["alternateIdentifiers"] = alternate_identifiers
+
+
+def _do_creators(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate creators from <creators>."""
+    creators = [convert_creator(c) for c in elem if c.tag == TAG_CREATOR]
+    attributes["creators"] = creators
+
+
+def _do_titles(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate titles from <titles>."""
+    titles = [convert_title(t) for t in elem if t.tag == TAG_TITLE]
+    attributes["titles"] = titles
+
+
+def _do_publisher(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate publisher from <publisher>."""
+    publisher_obj: Dict[str, Any] = {"name": get_text(elem)}
+    lang = elem.get(XML_LANG)
+    if lang:
+        publisher_obj["lang"] = lang
+    # Additional identifiers
+    if elem.get("publisherIdentifier"):
+        publisher_obj["publisherIdentifier"] = elem.get("publisherIdentifier")
+    if elem.get("publisherIdentifierScheme"):
+        publisher_obj["publisherIdentifierScheme"] = elem.get("publisherIdentifierScheme")
+    if elem.get("schemeURI"):
+        publisher_obj["schemeUri"] = elem.get("schemeURI")
+    attributes["publisher"] = publisher_obj
+
+
+def _do_publication_year(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate publicationYear from <publicationYear>, as an int where possible."""
+    pub_year = get_text(elem)
     if pub_year is not None:
         # Convert to int where possible
         try:
             attributes["publicationYear"] = int(pub_year)
         except ValueError:
             attributes["publicationYear"] = pub_year
-    # Subjects
-    subjects_elem = root.find("d:subjects", NSMAP)
-    subjects: List[Dict[str, Any]] = []
-    if subjects_elem is not None:
-        for s in subjects_elem.findall("d:subject", NSMAP):
-            subjects.append(convert_subject(s))
-    if subjects:
-        attributes["subjects"] = subjects
-    # Contributors
-    contrib_elem = root.find("d:contributors", NSMAP)
-    contributors: List[Dict[str, Any]] = []
-    if contrib_elem is not None:
-        for c in contrib_elem.findall("d:contributor", NSMAP):
-            contributors.append(convert_contributor(c))
-    if contributors:
-        attributes["contributors"] = contributors
-    # Dates
-    date_objs = convert_dates(root)
-    if date_objs:
-        attributes["dates"] = date_objs
-    # Language
-    lang_elem = root.find("d:language", NSMAP)
-    if lang_elem is not None and get_text(lang_elem) is not None:
-        attributes["language"] = get_text(lang_elem)
-    # Types
+
+
+def _do_resource_type(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate types (with crosswalks) and the container type from <resourceType>."""
     types_obj: Dict[str, Any] = {}
-    if resource_type_elem is not None:
-        rt_text = get_text(resource_type_elem)
-        rt_general = resource_type_general
-        if rt_text is not None:
-            types_obj["resourceType"] = rt_text
-        if rt_general is not None:
-            types_obj["resourceTypeGeneral"] = rt_general
-            # Add crosswalks
-            types_obj.update(resource_type_mappings(rt_general))
-    if types_obj:
-        attributes["types"] = types_obj
-    # Related identifiers
+    rt_text = get_text(elem)
+    rt_general = elem.get("resourceTypeGeneral")
+    if rt_text is not None:
+        types_obj["resourceType"] = rt_text
+    if rt_general is not None:
+        types_obj["resourceTypeGeneral"] = rt_general
+        # Add crosswalks
+        types_obj.update(resource_type_mappings(rt_general))
+        # Container type: use a generic container type for dataset
+        if rt_general.lower() == "dataset":
+            attributes.setdefault("container", {})["type"] = "DataRepository"
+    attributes["types"] = types_obj
+
+
+def _do_subjects(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate subjects from <subjects>."""
+    subjects = [convert_subject(s) for s in elem if s.tag == TAG_SUBJECT]
+    attributes["subjects"] = subjects
+
+
+def _do_contributors(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate contributors from <contributors>."""
+    contributors = [convert_contributor(c) for c in elem if c.tag == TAG_CONTRIBUTOR]
+    attributes["contributors"] = contributors
+
+
+def _do_dates(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate dates from <dates>."""
+    dates = [convert_date(d) for d in elem if d.tag == TAG_DATE]
+    attributes["dates"] = dates
+
+
+def _do_language(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate language from <language>."""
+    language = get_text(elem)
+    attributes["language"] = language
+
+
+def _do_related_identifiers(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate relatedIdentifiers and the container identifier from <relatedIdentifiers>."""
     related_identifiers: List[Dict[str, Any]] = []
-    for ri in root.findall("d:relatedIdentifiers/d:relatedIdentifier", NSMAP):
-        related_identifiers.append(convert_related_identifier(ri))
-    if related_identifiers:
-        attributes["relatedIdentifiers"] = related_identifiers
-    # Related items
-    related_items: List[Dict[str, Any]] = []
-    for ritem in root.findall("d:relatedItems/d:relatedItem", NSMAP):
-        related_items.append(convert_related_item(ritem))
-    if related_items:
-        attributes["relatedItems"] = related_items
-    # Sizes
+    purl_obj: Optional[Dict[str, Any]] = None
+    for ri in elem:
+        if ri.tag != TAG_RELATEDIDENTIFIER:
+            continue
+        ri_obj = convert_related_identifier(ri)
+        related_identifiers.append(ri_obj)
+        # Remember the first relatedIdentifier of type PURL for the container
+        if purl_obj is None and ri_obj.get("relatedIdentifierType") == "PURL":
+            purl_obj = ri_obj
+    # Container identifier – derive from the first relatedIdentifier of type PURL
+    if purl_obj is not None:
+        container_obj = attributes.setdefault("container", {})
+        container_obj["identifier"] = purl_obj["relatedIdentifier"]
+        container_obj["identifierType"] = purl_obj["relatedIdentifierType"]
+    attributes["relatedIdentifiers"] = related_identifiers
+
+
+def _do_related_items(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate relatedItems from <relatedItems>."""
+    related_items = [convert_related_item(ritem) for ritem in elem if ritem.tag == TAG_RELATEDITEM]
+    attributes["relatedItems"] = related_items
+
+
+def _do_sizes(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate sizes from <sizes>."""
     size_list: List[str] = []
-    for s_elem in root.findall("d:sizes/d:size", NSMAP):
+    for s_elem in elem:
+        if s_elem.tag != TAG_SIZE:
+            continue
         val = get_text(s_elem)
         if val is not None:
             size_list.append(val)
-    if size_list:
-        attributes["sizes"] = size_list
-    # Formats
+    attributes["sizes"] = size_list
+
+
+def _do_formats(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate formats from <formats>."""
     format_list: List[str] = []
-    for f_elem in root.findall("d:formats/d:format", NSMAP):
+    for f_elem in elem:
+        if f_elem.tag != TAG_FORMAT:
+            continue
         val = get_text(f_elem)
         if val is not None:
             format_list.append(val)
-    if format_list:
-        attributes["formats"] = format_list
-    # Version
-    version = get_text(root.find("d:version", NSMAP))
-    if version is not None:
-        attributes["version"] = version
-    # Rights list
+    attributes["formats"] = format_list
+
+
+def _do_version(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate version from <version>."""
+    version = get_text(elem)
+    attributes["version"] = version
+
+
+def _do_rights_list(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate rightsList from <rightsList>."""
     rights_objects: List[Dict[str, Any]] = []
-    for r_elem in root.findall("d:rightsList/d:rights", NSMAP):
+    for r_elem in elem:
+        if r_elem.tag != TAG_RIGHTS:
+            continue
         r_obj: Dict[str, Any] = {"rights": get_text(r_elem)}
-        lang = r_elem.attrib.get("{http://www.w3.org/XML/1998/namespace}lang")
+        lang = r_elem.get(XML_LANG)
         if lang:
             r_obj["lang"] = lang
-        if r_elem.attrib.get("rightsURI"):
-            r_obj["rightsUri"] = r_elem.attrib.get("rightsURI")
-        if r_elem.attrib.get("schemeURI"):
-            r_obj["schemeUri"] = r_elem.attrib.get("schemeURI")
-        if r_elem.attrib.get("rightsIdentifier"):
-            r_obj["rightsIdentifier"] = r_elem.attrib.get("rightsIdentifier")
-        if r_elem.attrib.get("rightsIdentifierScheme"):
-            r_obj["rightsIdentifierScheme"] = r_elem.attrib.get("rightsIdentifierScheme")
+        if r_elem.get("rightsURI"):
+            r_obj["rightsUri"] = r_elem.get("rightsURI")
+        if r_elem.get("schemeURI"):
+            r_obj["schemeUri"] = r_elem.get("schemeURI")
+        if r_elem.get("rightsIdentifier"):
+            r_obj["rightsIdentifier"] = r_elem.get("rightsIdentifier")
+        if r_elem.get("rightsIdentifierScheme"):
+            r_obj["rightsIdentifierScheme"] = r_elem.get("rightsIdentifierScheme")
         rights_objects.append(r_obj)
-    if rights_objects:
-        attributes["rightsList"] = rights_objects
-    # Descriptions
+    attributes["rightsList"] = rights_objects
+
+
+def _do_descriptions(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate descriptions and the container title from <descriptions>."""
     desc_objects: List[Dict[str, Any]] = []
-    for d_elem in root.findall("d:descriptions/d:description", NSMAP):
+    series_obj: Optional[Dict[str, Any]] = None
+    for d_elem in elem:
+        if d_elem.tag != TAG_DESCRIPTION:
+            continue
         d_obj: Dict[str, Any] = {"description": get_text(d_elem)}
-        lang = d_elem.attrib.get("{http://www.w3.org/XML/1998/namespace}lang")
+        lang = d_elem.get(XML_LANG)
         if lang:
             d_obj["lang"] = lang
-        desc_type = d_elem.attrib.get("descriptionType")
+        desc_type = d_elem.get("descriptionType")
         if desc_type:
             d_obj["descriptionType"] = desc_type
+            if series_obj is None and desc_type == "SeriesInformation":
+                series_obj = d_obj
         desc_objects.append(d_obj)
-    if desc_objects:
-        attributes["descriptions"] = desc_objects
-    # Geolocations
-    geolocations: List[Dict[str, Any]] = []
-    for gl in root.findall("d:geoLocations/d:geoLocation", NSMAP):
-        geolocations.append(convert_geolocation(gl))
-    if geolocations:
-        attributes["geoLocations"] = geolocations
-    # Funding references
+    # Container title from the first description of type SeriesInformation
+    if series_obj is not None:
+        attributes.setdefault("container", {})["title"] = series_obj["description"]
+    attributes["descriptions"] = desc_objects
+
+
+def _do_geolocations(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate geoLocations from <geoLocations>."""
+    geolocations = [convert_geolocation(gl) for gl in elem if gl.tag == TAG_GEOLOCATION]
+    attributes["geoLocations"] = geolocations
+
+
+def _do_funding_references(elem: ET.Element, attributes: Dict[str, Any]) -> None:
+    """Populate fundingReferences from <fundingReferences>."""
     funding_refs: List[Dict[str, Any]] = []
-    for fr in root.findall("d:fundingReferences/d:fundingReference", NSMAP):
-        fr_obj: Dict[str, Any] = {}
-        # funderName
-        val = get_text(fr.find("d:funderName", NSMAP))
-        if val is not None:
-            fr_obj["funderName"] = val
-        funder_id = fr.find("d:funderIdentifier", NSMAP)
-        if funder_id is not None:
-            fr_obj["funderIdentifier"] = get_text(funder_id)
-            if funder_id.attrib.get("funderIdentifierType"):
-                fr_obj["funderIdentifierType"] = funder_id.attrib.get("funderIdentifierType")
-            if funder_id.attrib.get("schemeURI"):
-                fr_obj["schemeUri"] = funder_id.attrib.get("schemeURI")
-        # Award number (with URI)
-        award_number = fr.find("d:awardNumber", NSMAP)
-        if award_number is not None:
-            fr_obj["awardNumber"] = get_text(award_number)
-            if award_number.attrib.get("awardURI"):
-                fr_obj["awardUri"] = award_number.attrib.get("awardURI")
-        # Award title
-        award_title = get_text(fr.find("d:awardTitle", NSMAP))
-        if award_title is not None:
-            fr_obj["awardTitle"] = award_title
+    for fr in elem:
+        if fr.tag != TAG_FUNDINGREFERENCE:
+            continue
+        fr_obj = convert_funding_reference(fr)
         if fr_obj:
             funding_refs.append(fr_obj)
-    if funding_refs:
-        attributes["fundingReferences"] = funding_refs
+    attributes["fundingReferences"] = funding_refs
+
+
+# Top-level DataCite elements and the handler that populates ``attributes``
+# from each.  ``build_json_from_xml`` dispatches on ``element.tag`` in a single
+# pass over the root's children instead of re-searching the tree per field.
+HANDLERS: Dict[str, Callable[[ET.Element, Dict[str, Any]], None]] = {
+    _q("identifier"): _do_identifier,
+    _q("creators"): _do_creators,
+    _q("titles"): _do_titles,
+    _q("publisher"): _do_publisher,
+    _q("publicationYear"): _do_publication_year,
+    _q("resourceType"): _do_resource_type,
+    _q("subjects"): _do_subjects,
+    _q("contributors"): _do_contributors,
+    _q("dates"): _do_dates,
+    _q("language"): _do_language,
+    _q("alternateIdentifiers"): _do_alternate_identifiers,
+    _q("relatedIdentifiers"): _do_related_identifiers,
+    _q("sizes"): _do_sizes,
+    _q("formats"): _do_formats,
+    _q("version"): _do_version,
+    _q("rightsList"): _do_rights_list,
+    _q("descriptions"): _do_descriptions,
+    _q("geoLocations"): _do_geolocations,
+    _q("fundingReferences"): _do_funding_references,
+    _q("relatedItems"): _do_related_items,
+}
+
+# Key order of ``attributes`` in the emitted JSON.  Handlers run in document
+# order and store whatever they extracted, empty or not; the result is then
+# built in one pass in this order, leaving out absent values (see _ABSENT).
+ATTRIBUTE_ORDER = (
+    "doi",
+    "prefix",
+    "suffix",
+    "identifiers",
+    "alternateIdentifiers",
+    "creators",
+    "titles",
+    "publisher",
+    "container",
+    "publicationYear",
+    "subjects",
+    "contributors",
+    "dates",
+    "language",
+    "types",
+    "relatedIdentifiers",
+    "relatedItems",
+    "sizes",
+    "formats",
+    "version",
+    "rightsList",
+    "descriptions",
+    "geoLocations",
+    "fundingReferences",
+    "xml",
+)
+# Key order of ``container``.  Its fields come from resourceType,
+# relatedIdentifiers and descriptions, which may appear in any order (the
+# kernel-4 XSD uses xs:all), so the dict is re-keyed into this order.
+CONTAINER_ORDER = ("type", "identifier", "identifierType", "title")
+# Extracted values that mean "not present"; ``doi`` is always emitted.
+_ABSENT = (None, "", [], {})
+
+
+def build_json_from_xml(xml_bytes: Union[bytes, str]) -> Dict[str, Any]:
+    """Parse a DataCite XML document and build the corresponding JSON structure.
+
+    The document should be passed as the raw bytes read from disk; those bytes
+    are parsed and base64-encoded as-is.  A ``str`` is still accepted: it is
+    parsed as text (ignoring any encoding in its XML declaration) and its
+    UTF-8 encoding is what gets base64-encoded.
+    """
+    # Parse the XML document
+    if isinstance(xml_bytes, str):
+        if _TEXT_PARSER is not None:
+            root = ET.fromstring(xml_bytes.encode("utf-8"), _TEXT_PARSER)
+        else:
+            root = ET.fromstring(xml_bytes)
+        xml_bytes = xml_bytes.encode("utf-8")
+    else:
+        root = ET.fromstring(xml_bytes, _PARSER)
+    extracted: Dict[str, Any] = {}
+    for child in root:
+        handler = HANDLERS.get(child.tag)
+        if handler is not None:
+            handler(child, extracted)
     # Encode the original XML as base64 and include as xml attribute
-    xml_b64 = base64.b64encode(xml_str.encode("utf-8")).decode("ascii")
-    attributes["xml"] = xml_b64
+    extracted["xml"] = _b64encode(xml_bytes).decode("ascii")
+    container = extracted.get("container")
+    if container:
+        extracted["container"] = {key: container[key] for key in CONTAINER_ORDER if key in container}
+    doi = extracted.get("doi")
+    attributes: Dict[str, Any] = {"doi": doi}
+    attributes.update(
+        (key, extracted[key]) for key in ATTRIBUTE_ORDER[1:] if extracted.get(key) not in _ABSENT
+    )
     # Assemble final JSON object
     record = {
         "data": {
@@ -598,21 +878,157 @@ def build_json_from_xml(xml_str: str) -> Dict[str, Any]:
     return record
 
 
+def build_json_from_xml_batch(documents: Iterable[Union[bytes, str]]) -> Iterator[Dict[str, Any]]:
+    """Convert many DataCite XML documents, yielding one JSON record per input.
+
+    All documents share the module-level parser and encoders, so per-record
+    setup cost is paid once for the whole batch.
+    """
+    for xml_bytes in documents:
+        yield build_json_from_xml(xml_bytes)
+
+
+def dump_json(obj: Dict[str, Any]) -> bytes:
+    """Serialize ``obj`` as pretty-printed UTF-8 JSON followed by a newline.
+
+    Uses ``orjson`` when it is installed and the stdlib ``json`` module
+    otherwise; both produce the same two-space-indented output.  Values orjson
+    rejects (e.g. integers beyond 64 bits) fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    return (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def _convert_one(xml_path: str, out_path: str) -> Optional[str]:
+    """Convert one XML file and write its JSON to ``out_path``; runs in a worker.
+
+    Returns None on success, or an ``"<xml_path>: <error>"`` message.  Errors
+    are returned as plain strings because parser exceptions (e.g. lxml's
+    XMLSyntaxError) cannot be pickled back to the parent process.  Nothing is
+    written for a file that fails to convert.
+    """
+    try:
+        with open(xml_path, "rb") as f:
+            xml_data = f.read()
+        data = dump_json(build_json_from_xml(xml_data))
+        with open(out_path, "wb") as out:
+            out.write(data)
+    except Exception as exc:  # report per file and let the batch continue
+        return f"{xml_path}: {exc}"
+    return None
+
+
+class OutputClashError(ValueError):
+    """Raised when several batch inputs would be written to the same output file."""
+
+
+def convert_files(
+    paths: List[str], out_dir: str, workers: Optional[int] = None
+) -> Tuple[List[str], List[str]]:
+    """Convert many XML files in parallel, writing ``<out_dir>/<name>.json`` for each.
+
+    Parsing, encoding and serialization are CPU-bound, so the files are spread
+    over a process pool (``workers`` processes, default: one per CPU).
+    A file that fails to convert does not stop the batch.  Returns the paths
+    of the written JSON files and the ``"<xml_path>: <error>"`` messages for
+    failed files, both in input order.  Raises
+    ``OutputClashError`` before converting anything if two inputs share a file
+    name and would therefore be written to the same output file, and
+    ``ValueError`` if ``workers`` is less than 1.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    out_paths = [
+        os.path.join(out_dir, os.path.splitext(os.path.basename(p))[0] + ".json") for p in paths
+    ]
+    sources: Dict[str, List[str]] = {}
+    for xml_path, out_path in zip(paths, out_paths):
+        sources.setdefault(out_path, []).append(xml_path)
+    clashes = [f"{out} <- {', '.join(srcs)}" for out, srcs in sources.items() if len(srcs) > 1]
+    if clashes:
+        raise OutputClashError("several inputs would write the same output file: " + "; ".join(clashes))
+    os.makedirs(out_dir, exist_ok=True)
+    if not paths:
+        return [], []
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # A few chunks per worker keeps the pool balanced without paying IPC per file.
+    chunksize = max(1, len(paths) // (workers * 4))
+    written: List[str] = []
+    failures: List[str] = []
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for out_path, error in zip(out_paths, ex.map(_convert_one, paths, out_paths, chunksize=chunksize)):
+            if error is None:
+                written.append(out_path)
+            else:
+                failures.append(error)
+    return written, failures
+
+
+def _expand_inputs(inputs: List[str]) -> List[str]:
+    """Expand directories in ``inputs`` to the ``*.xml`` files they contain."""
+    paths: List[str] = []
+    for entry in inputs:
+        if os.path.isdir(entry):
+            paths.extend(
+                os.path.join(entry, name) for name in sorted(os.listdir(entry)) if name.endswith(".xml")
+            )
+        else:
+            paths.append(entry)
+    return paths
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that take a count of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Convert DataCite XML to JSON.")
-    parser.add_argument("xml_file", help="Path to the DataCite XML file to convert")
+    parser.add_argument(
+        "xml_files",
+        nargs="+",
+        metavar="xml_file",
+        help="Path to the DataCite XML file to convert; several files or directories of *.xml files may be given",
+    )
     parser.add_argument("--output", "-o", help="Write JSON output to this file instead of stdout")
+    parser.add_argument("--output-dir", help="Directory to write one JSON file per input (required for batch conversion)")
+    parser.add_argument("--workers", type=_positive_int, help="Number of worker processes for batch conversion (default: CPU count)")
     args = parser.parse_args()
-    with open(args.xml_file, "r", encoding="utf-8") as f:
-        xml_data = f.read()
-    json_obj = build_json_from_xml(xml_data)
+    if len(args.xml_files) == 1 and not os.path.isdir(args.xml_files[0]) and not args.output_dir:
+        with open(args.xml_files[0], "rb") as f:
+            xml_data = f.read()
+        json_obj = build_json_from_xml(xml_data)
+        if args.output:
+            with open(args.output, "wb") as out:
+                out.write(dump_json(json_obj))
+        else:
+            sys.stdout.buffer.write(dump_json(json_obj))
+        return
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as out:
-            json.dump(json_obj, out, ensure_ascii=False, indent=2)
-            out.write("\n")
-    else:
-        json.dump(json_obj, sys.stdout, ensure_ascii=False, indent=2)
-        sys.stdout.write("\n")
+        parser.error("--output only applies to a single input file; use --output-dir for batch conversion")
+    if not args.output_dir:
+        parser.error("--output-dir is required when converting several files or a directory")
+    paths = _expand_inputs(args.xml_files)
+    try:
+        written, failures = convert_files(paths, args.output_dir, workers=args.workers)
+    except OutputClashError as e:
+        parser.error(str(e))
+    for failure in failures:
+        print(f"ERROR: {failure}", file=sys.stderr)
+    print(f"Converted {len(written)} file(s) into {args.output_dir}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
 
 
 if __name__ == "__main__":